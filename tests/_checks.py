@@ -0,0 +1,92 @@
+"""
+Vectorised column checks shared by the test modules.
+"""
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Optional: use h3 if available for strict res check
+try:
+    import h3
+    HAS_H3 = True
+except Exception:
+    HAS_H3 = False
+
+
+# ---- Time bins ----
+NAT = np.iinfo(np.int64).min
+NS_PER_S = 1_000_000_000
+
+
+def wall_clock_ns(local: pd.Series) -> np.ndarray:
+    # Drop the tz but keep local wall time, so integer maths sees local hours
+    return local.dt.tz_localize(None).to_numpy(dtype="datetime64[ns]").view("i8")
+
+
+def off_grid(ns: np.ndarray, step_s: int) -> np.ndarray:
+    # NaT or not on a whole multiple of step_s seconds since the epoch
+    return (ns == NAT) | ((ns // NS_PER_S) % step_s != 0)
+
+
+# ---- H3 indexes ----
+def _h3_resolution(idx: str) -> int:
+    try:
+        return h3.get_resolution(idx)
+    except Exception:
+        return -1
+
+
+# Elementwise h3 call without the pandas .map dispatch per row
+_h3_resolution_ufunc = np.frompyfunc(_h3_resolution, 1, 1)
+_H3_RES8_PATTERN = r"^[0-9a-f]{15}$"
+
+
+def h3_res8_mask(idx: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns boolean arrays (is_str, ok) for an H3 index column.
+    ok is a strict resolution-8 check when h3 is installed, otherwise the
+    heuristic of 15 lowercase hex characters.
+    """
+    arr = idx.to_numpy(dtype=object)
+    is_str = np.fromiter((isinstance(x, str) for x in arr), dtype=bool, count=len(arr))
+    strs = arr[is_str]
+    ok = np.zeros(len(arr), dtype=bool)
+    if HAS_H3:
+        ok[is_str] = _h3_resolution_ufunc(strs).astype(np.int8) == 8
+    else:
+        # RE2-backed Arrow kernel: one linear-time scan over the string buffer
+        matched = pc.match_substring_regex(pa.array(strs, type=pa.string()), _H3_RES8_PATTERN)
+        ok[is_str] = matched.to_numpy(zero_copy_only=False)
+    return is_str, ok
+
+
+# ---- Text columns ----
+_EMPTY_TEXT = pa.array(["", "nan", "none"])
+
+
+def _is_empty_text(arr) -> np.ndarray:
+    if not pa.types.is_string(arr.type):
+        arr = arr.cast(pa.string())
+    cleaned = pc.utf8_lower(pc.utf8_trim_whitespace(arr))
+    return pc.fill_null(pc.is_in(cleaned, value_set=_EMPTY_TEXT), False).to_numpy(zero_copy_only=False)
+
+
+def empty_text_counts(df: pd.DataFrame, cols: list) -> dict:
+    """
+    Count null / empty / "nan" / "none" cells per column using Arrow utf8 kernels.
+    Category columns only clean their labels and count rows through the codes.
+    """
+    counts = {}
+    for col in cols:
+        s = df[col]
+        cnt = int(s.isna().sum())
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            bad = _is_empty_text(pa.array(s.cat.categories))
+            codes = s.cat.codes.to_numpy()
+            cnt += int(bad[codes[codes >= 0]].sum())
+        else:
+            cnt += int(_is_empty_text(pa.array(s)).sum())
+        if cnt:
+            counts[col] = cnt
+    return counts
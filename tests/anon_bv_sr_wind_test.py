@@ -1,9 +1,11 @@
 
-import re
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
 
+from _checks import HAS_H3, empty_text_counts, h3_res8_mask, off_grid, wall_clock_ns
+
 # ---- Config ----
 ROOT = Path(__file__).resolve().parents[1]  
 CSV_PATH = ROOT / "output" / "anon_sr_data.csv"
@@ -41,23 +43,16 @@ PROHIBITED_COLS = [
 LOCAL_TZ = "Africa/Johannesburg"
 UTC = "UTC"
 
-# Optional: use h3 if available for strict res check
-try:
-    import h3
-    HAS_H3 = True
-except Exception:
-    HAS_H3 = False
-
 
 def _skip_if_missing_file():
     if not CSV_PATH.exists():
         pytest.skip(f"CSV not found at {CSV_PATH.resolve()}")
 
 
-@pytest.fixture(scope="module")
-def df():
+@pytest.fixture(scope="session")
+def df(load_csv):
     _skip_if_missing_file()
-    return pd.read_csv(CSV_PATH)
+    return load_csv(CSV_PATH)
 
 
 def _parse_to_local(series: pd.Series) -> pd.Series:
@@ -69,23 +64,35 @@ def _parse_to_local(series: pd.Series) -> pd.Series:
         return s.dt.tz_convert(LOCAL_TZ)
 
 
-def _parse_to_utc(series: pd.Series) -> pd.Series:
-    return _parse_to_local(series).dt.tz_convert(UTC)
+# Parsed timestamp columns keyed by (id(df), column). df is session-scoped, so the
+# ids stay valid and each column goes through pd.to_datetime once per run.
+_PARSED_CACHE: dict = {}
+
+
+def _parsed(df: pd.DataFrame, col: str, tz: str = LOCAL_TZ) -> pd.Series:
+    key = (id(df), col)
+    if key not in _PARSED_CACHE:
+        _PARSED_CACHE[key] = _parse_to_local(df[col])
+    local = _PARSED_CACHE[key]
+    # tz_convert only swaps the tz metadata; the underlying instants are shared
+    return local if tz == LOCAL_TZ else local.dt.tz_convert(tz)
 
 
 def test_required_columns_present(df):
-    missing = [c for c in REQUIRED_COLS if c not in df.columns]
+    cols = frozenset(df.columns)
+    missing = [c for c in REQUIRED_COLS if c not in cols]
     assert not missing, f"Missing required columns: {missing}"
 
 
 def test_prohibited_columns_absent(df):
-    present = [c for c in PROHIBITED_COLS if c in df.columns]
+    cols = frozenset(df.columns)
+    present = [c for c in PROHIBITED_COLS if c in cols]
     assert not present, f"Prohibited columns present in anonymised data: {present}"
 
 
 def test_timestamps_parse_and_order(df):
-    c = _parse_to_utc(df["creation_timestamp"])
-    d = _parse_to_utc(df["completion_timestamp"])
+    c = _parsed(df, "creation_timestamp", UTC)
+    d = _parsed(df, "completion_timestamp", UTC)
 
     # creation must always be valid
     assert c.notna().all(), "Unparseable creation_timestamp values"
@@ -101,10 +108,10 @@ def test_timestamps_parse_and_order(df):
 
 def test_creation_timestamp_is_6h_bins(df):
     # Anonymisation spec: temporal accuracy ~ 6 hours
-    c_local = _parse_to_local(df["creation_timestamp"])
+    c_local = _parsed(df, "creation_timestamp")
     good_hours = {0, 6, 12, 18}
-    bad = (c_local.dt.minute != 0) | (c_local.dt.second != 0) | (~c_local.dt.hour.isin(good_hours))
-    assert (~bad).all(), f"{int(bad.sum())} rows not rounded to 6-hour bins (expected hours {sorted(good_hours)})"
+    bad = off_grid(wall_clock_ns(c_local), 6 * 3600)
+    assert not bad.any(), f"{int(bad.sum())} rows not rounded to 6-hour bins (expected hours {sorted(good_hours)})"
 
 
 def test_columns_not_null_where_required(df):
@@ -113,50 +120,36 @@ def test_columns_not_null_where_required(df):
     assert not offenders, f"Nulls in mandatory columns: {offenders}"
 
 
-def _looks_like_h3_res8(idx: str) -> bool:
-    if not isinstance(idx, str):
-        return False
-    if HAS_H3:
-        try:
-            return h3.get_resolution(idx) == 8
-        except Exception:
-            return False
-    # Heuristic if h3 not installed: 15 lowercase hex characters
-    return bool(re.fullmatch(r"[0-9a-f]{15}", idx))
-
-
 def test_h3_index_valid_res8(df):
-    idx = df["h3_level8_index"]
-    not_str = (~idx.map(lambda x: isinstance(x, str))).sum()
+    is_str, ok = h3_res8_mask(df["h3_level8_index"])
+    not_str = int((~is_str).sum())
     assert not_str == 0, f"{not_str} H3 indexes are not strings"
-    bad = (~idx.map(_looks_like_h3_res8)).sum()
+    bad = int((~ok).sum())
     msg = "" if HAS_H3 else " (heuristic used; install 'h3' for strict check)"
     assert bad == 0, f"{bad} invalid/non-res8 H3 indexes{msg}"
 
 
 def test_wind_columns_bounds(df):
-    wd = pd.to_numeric(df["wind direction degree"], errors="coerce")
-    ws = pd.to_numeric(df["wind speed m/s"], errors="coerce")
-    assert wd.notna().all(), "NaN/unparseable wind direction values"
-    assert ws.notna().all(), "NaN/unparseable wind speed values"
-    assert ((wd >= 0) & (wd <= 360)).all(), "Wind direction outside [0, 360]"
-    assert (ws >= 0).all(), "Negative wind speeds"
-    assert (ws <= 40).all(), "Unreasonably high wind speeds (>40 m/s)"
+    wd = pd.to_numeric(df["wind direction degree"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    ws = pd.to_numeric(df["wind speed m/s"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    assert not np.isnan(wd).any(), "NaN/unparseable wind direction values"
+    assert not np.isnan(ws).any(), "NaN/unparseable wind speed values"
+    assert np.all((wd >= 0) & (wd <= 360)), "Wind direction outside [0, 360]"
+    assert np.all(ws >= 0), "Negative wind speeds"
+    assert np.all(ws <= 40), "Unreasonably high wind speeds (>40 m/s)"
 
 
 def test_text_columns_nonempty(df):
     text_cols = ["official_suburb", "directorate", "department", "branch", "section", "code_group"]
-    issues = {}
-    for col in text_cols:
-        s = df[col].astype(str).str.strip().str.lower()
-        empty = (s == "") | s.isin(["nan", "none"])
-        cnt = int(empty.sum())
-        if cnt:
-            issues[col] = cnt
+    issues = empty_text_counts(df, text_cols)
     assert not issues, f"Empty values in text columns: {issues}"
 
 
 def test_creation_year_2020(df):
-    c = _parse_to_local(df["creation_timestamp"])
-    not_2020 = (~(c.dt.year == 2020)).sum()
+    c = _parsed(df, "creation_timestamp")
+    # Local year boundaries as epoch ns, compared against the UTC instants (NaT is int64 min)
+    lo = pd.Timestamp("2020-01-01", tz=LOCAL_TZ).value
+    hi = pd.Timestamp("2021-01-01", tz=LOCAL_TZ).value
+    ns = c.to_numpy(dtype="datetime64[ns]").view("i8")
+    not_2020 = int((~((ns >= lo) & (ns < hi))).sum())
     assert not_2020 == 0, f"{int(not_2020)} rows have creation year != 2020"
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import pytest
 from pathlib import Path
@@ -5,9 +6,9 @@ from pathlib import Path
 ROOT = Path(__file__).resolve().parents[1]  
 CSV_PATH = ROOT / "output" / "bv_wind_processed.csv"
 
-@pytest.fixture(scope="module")
-def df():
-    return pd.read_csv(CSV_PATH)
+@pytest.fixture(scope="session")
+def df(load_csv):
+    return load_csv(CSV_PATH)
 
 def test_required_columns(df):
     required = {"wind direction degree", "wind speed m/s", "DateTime"}
@@ -19,16 +20,19 @@ def test_no_extra_columns(df):
     assert not extras, f"Unexpected columns: {extras}"
 
 def test_wind_direction_bounds(df):
-    wd = pd.to_numeric(df["wind direction degree"], errors="coerce")
-    assert wd.notna().all(), "Wind direction contains NaN/unparseable"
-    assert (wd >= 0).all() and (wd <= 360).all(), "Wind direction outside [0, 360]"
+    wd = pd.to_numeric(df["wind direction degree"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    assert not np.isnan(wd).any(), "Wind direction contains NaN/unparseable"
+    assert np.all((wd >= 0) & (wd <= 360)), "Wind direction outside [0, 360]"
 
 def test_wind_speed_bounds(df):
-    ws = pd.to_numeric(df["wind speed m/s"], errors="coerce")
-    assert ws.notna().all(), "Wind speed contains NaN/unparseable"
-    assert (ws >= 0).all(), "Negative wind speeds"
-    assert (ws <= 40).all(), "Wind speed unreasonably high (>40 m/s)"
+    ws = pd.to_numeric(df["wind speed m/s"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    assert not np.isnan(ws).any(), "Wind speed contains NaN/unparseable"
+    assert np.all(ws >= 0), "Negative wind speeds"
+    assert np.all(ws <= 40), "Wind speed unreasonably high (>40 m/s)"
 
 
 def test_no_duplicates(df):
-    assert not df.duplicated().any(), "Duplicate rows found"
+    h = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    # Only fall back to the exact check if two row hashes agree
+    if np.unique(h).size != h.size:
+        assert not df.duplicated().any(), "Duplicate rows found"
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import _checks
+from _checks import NAT, NS_PER_S, empty_text_counts, h3_res8_mask, off_grid, wall_clock_ns
+
+RES8 = "88ad361ad3fffff"  # Cape Town, resolution 8
+RES9 = "89ad361ad3bffff"  # same point, resolution 9
+
+
+def test_off_grid_flags_nat_and_off_bin_rows():
+    step = 30 * 60
+    ns = np.array([0, step * NS_PER_S, 3 * step * NS_PER_S, step * NS_PER_S + NS_PER_S, NAT], dtype=np.int64)
+    assert off_grid(ns, step).tolist() == [False, False, False, True, True]
+
+
+def test_wall_clock_ns_keeps_local_time():
+    local = pd.Series(pd.to_datetime(["2020-01-01 06:00", None]).tz_localize("Africa/Johannesburg"))
+    ns = wall_clock_ns(local)
+    assert ns[0] == pd.Timestamp("2020-01-01 06:00").value
+    assert ns[1] == NAT
+    assert off_grid(ns, 6 * 3600).tolist() == [False, True]
+
+
+def test_empty_text_counts_object_column():
+    df = pd.DataFrame({
+        "text": ["ok", "", "  ", " None ", "NaN", None, np.nan],
+        "clean": ["a", "b", "c", "d", "e", "f", "g"],
+    })
+    assert empty_text_counts(df, ["text", "clean"]) == {"text": 6}
+
+
+def test_empty_text_counts_category_column():
+    s = pd.Series(["ok", " none ", "ok", None, "", " none "], dtype="category")
+    assert empty_text_counts(pd.DataFrame({"c": s}), ["c"]) == {"c": 4}
+
+
+@pytest.fixture(params=[True, False], ids=["h3", "heuristic"])
+def has_h3(request, monkeypatch):
+    if request.param and not _checks.HAS_H3:
+        pytest.skip("h3 not installed")
+    monkeypatch.setattr(_checks, "HAS_H3", request.param)
+    return request.param
+
+
+def test_h3_res8_mask(has_h3):
+    idx = pd.Series([RES8, RES9, "not-a-cell", "88ad361ad3fffzz", 123, None], dtype=object)
+    is_str, ok = h3_res8_mask(idx)
+    assert is_str.tolist() == [True, True, True, True, False, False]
+    assert ok[0]
+    assert not ok[2:].any()
+    # Only h3 itself can tell a resolution-9 cell from a resolution-8 one
+    assert ok[1] == (not has_h3)
@@ -0,0 +1,87 @@
+import os
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import conftest
+
+
+@pytest.fixture
+def csv(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n2,y\n")
+    return path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    # Count CSV parses, so each test can tell a snapshot hit from a rebuild
+    calls = []
+    parse = conftest._parse_csv
+
+    def _counting(path):
+        calls.append(path)
+        return parse(path)
+
+    monkeypatch.setattr(conftest, "_parse_csv", _counting)
+    return calls
+
+
+def _set_mtime(path, t):
+    os.utime(path, (t, t))
+
+
+def test_snapshot_written_with_config(csv, parses):
+    df = conftest._read_cached(csv)
+    cache = conftest._parquet_cache(csv)
+    assert df["a"].tolist() == [1, 2]
+    assert len(parses) == 1
+    assert pq.read_schema(cache).metadata[conftest.SNAPSHOT_CONFIG_KEY] == conftest.SNAPSHOT_CONFIG
+    assert not list(csv.parent.glob(".*.tmp")), "Temp snapshot left behind"
+
+
+def test_snapshot_reused_when_newer(csv, parses):
+    conftest._read_cached(csv)
+    _set_mtime(csv, 1_000_000)
+    _set_mtime(conftest._parquet_cache(csv), 2_000_000)
+
+    df = conftest._read_cached(csv)
+    assert df["a"].tolist() == [1, 2]
+    assert len(parses) == 1, "Snapshot not reused"
+
+
+def test_snapshot_rebuilt_when_csv_newer(csv, parses):
+    conftest._read_cached(csv)
+    csv.write_text("a,b\n3,z\n")
+    _set_mtime(conftest._parquet_cache(csv), 1_000_000)
+    _set_mtime(csv, 2_000_000)
+
+    df = conftest._read_cached(csv)
+    assert df["a"].tolist() == [3]
+    assert len(parses) == 2
+
+
+def test_snapshot_rebuilt_on_config_mismatch(csv, parses):
+    # A snapshot without the config key, e.g. written by an older parse config
+    cache = conftest._parquet_cache(csv)
+    pd.DataFrame({"a": [9], "b": ["stale"]}).to_parquet(cache)
+    _set_mtime(csv, 1_000_000)
+    _set_mtime(cache, 2_000_000)
+
+    df = conftest._read_cached(csv)
+    assert df["a"].tolist() == [1, 2]
+    assert len(parses) == 1
+    assert pq.read_schema(cache).metadata[conftest.SNAPSHOT_CONFIG_KEY] == conftest.SNAPSHOT_CONFIG
+
+
+def test_snapshot_rebuilt_when_corrupt(csv, parses):
+    cache = conftest._parquet_cache(csv)
+    cache.write_bytes(b"PAR1 truncated")
+    _set_mtime(csv, 1_000_000)
+    _set_mtime(cache, 2_000_000)
+
+    df = conftest._read_cached(csv)
+    assert df["a"].tolist() == [1, 2]
+    assert len(parses) == 1
+    assert pq.read_table(cache).num_rows == 2, "Corrupt snapshot not rewritten"
@@ -1,10 +1,11 @@
 import os
 from pathlib import Path
-import re
 import pandas as pd
 import numpy as np
 import pytest
 
+from _checks import HAS_H3, empty_text_counts, h3_res8_mask, off_grid, wall_clock_ns
+
 # ---- Paths & config ----
 ROOT = Path(__file__).resolve().parents[1]
 CSV_PATH = ROOT / "output" / "sr_with_wind.csv"
@@ -32,13 +33,7 @@ OPTIONAL_NULL_OK = ["cause_code_group", "cause_code"]
 
 LOCAL_TZ = "Africa/Johannesburg"  # treat naive timestamps as local CCT time
 UTC = "UTC"
-
-# Optional h3 dependency
-try:
-    import h3
-    HAS_H3 = True
-except Exception:
-    HAS_H3 = False
+_TZ_SUFFIX = r"(?:Z|[+-]\d{2}:?\d{2})$"  # trailing UTC designator or offset
 
 
 def _skip_if_missing_file():
@@ -81,24 +76,27 @@ def _parse_to_utc(series: pd.Series) -> pd.Series:
     - If value is naive -> localize to Africa/Johannesburg -> convert to UTC
     - If value is aware -> convert to UTC directly
     """
-    s = pd.to_datetime(series.astype(str).str.strip(), errors="coerce", utc=False)
+    if pd.api.types.is_datetime64_any_dtype(series):
+        # Already parsed by the CSV reader: one vectorised localise/convert
+        if series.dt.tz is None:
+            return series.dt.tz_localize(LOCAL_TZ).dt.tz_convert(UTC)
+        return series.dt.tz_convert(UTC)
 
-    def to_utc(x):
-        if pd.isna(x):
-            return pd.NaT
-        if x.tzinfo is None:
-            return x.tz_localize(LOCAL_TZ).tz_convert(UTC)
-        else:
-            return x.tz_convert(UTC)
+    # Split on the raw text so naive and aware values are never parsed together
+    raw = series.astype(str).str.strip()
+    aware = raw.str.contains(_TZ_SUFFIX, regex=True).to_numpy(dtype=bool)
+    out = pd.Series(pd.NaT, index=series.index, dtype=f"datetime64[ns, {UTC}]")
+    out[aware] = pd.to_datetime(raw[aware], errors="coerce", utc=True, format="mixed")
+    naive = pd.to_datetime(raw[~aware], errors="coerce", format="mixed")
+    out[~aware] = naive.dt.tz_localize(LOCAL_TZ).dt.tz_convert(UTC)
+    return out
 
-    return s.map(to_utc)
 
 
-
-@pytest.fixture(scope="module")
-def df():
+@pytest.fixture(scope="session")
+def df(load_csv):
     _skip_if_missing_file()
-    return pd.read_csv(CSV_PATH)
+    return load_csv(CSV_PATH)
 
 
 def test_file_exists():
@@ -107,18 +105,22 @@ def test_file_exists():
 
 
 def test_required_columns_present(df):
-    missing = [c for c in REQUIRED_COLS if c not in df.columns]
+    cols = frozenset(df.columns)
+    missing = [c for c in REQUIRED_COLS if c not in cols]
     assert not missing, f"Missing required columns: {missing}"
 
 
 def test_no_full_row_duplicates(df):
-    assert not df.duplicated().any(), "Duplicate full rows detected"
+    # One uint64 hash per row; only fall back to the exact check if two hashes agree
+    h = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    if np.unique(h).size != h.size:
+        assert not df.duplicated().any(), "Duplicate full rows detected"
 
 
 def test_notification_number_uniqueness(df):
     if "notification_number" in df.columns:
-        non_null = df["notification_number"].dropna()
-        dups = non_null.duplicated().sum()
+        non_null = df["notification_number"].dropna().to_numpy()
+        dups = non_null.size - np.unique(non_null).size
         assert dups == 0, f"{dups} duplicate notification_number values found"
 
 
@@ -143,68 +145,50 @@ def test_creation_rounded_is_30_min_bins(df):
     # Check rounding semantics in LOCAL time (how it was produced)
     cr_local = _parse_to_local(df["creation_rounded"])
     assert cr_local.notna().all(), "Unparseable creation_rounded values"
-    bad = (cr_local.dt.second != 0) | (~cr_local.dt.minute.isin([0, 30]))
-    assert (~bad).all(), f"{int(bad.sum())} rows not aligned to 30-minute bins"
+    bad = off_grid(wall_clock_ns(cr_local), 30 * 60)
+    assert not bad.any(), f"{int(bad.sum())} rows not aligned to 30-minute bins"
 
 
 def test_lat_lon_bounds_and_validity(df):
-    lat = pd.to_numeric(df["latitude"], errors="coerce")
-    lon = pd.to_numeric(df["longitude"], errors="coerce")
-    assert lat.notna().all() and lon.notna().all(), "NaN or unparseable lat/lon values"
+    lat = pd.to_numeric(df["latitude"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    lon = pd.to_numeric(df["longitude"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    assert not (np.isnan(lat).any() or np.isnan(lon).any()), "NaN or unparseable lat/lon values"
     # Cape Town rough bounding box
     lat_ok = (lat >= -34.5) & (lat <= -33.0)
     lon_ok = (lon >= 18.0) & (lon <= 19.5)
-    assert lat_ok.all(), f"{int((~lat_ok).sum())} latitudes outside Cape Town bounds"
-    assert lon_ok.all(), f"{int((~lon_ok).sum())} longitudes outside Cape Town bounds"
-
-
-def _looks_like_h3_res8(idx: str) -> bool:
-    if not isinstance(idx, str):
-        return False
-    if HAS_H3:
-        try:
-            return h3.get_resolution(idx) == 8
-        except Exception:
-            return False
-    # Heuristic if h3 not installed: 15 lowercase hex chars
-    return bool(re.fullmatch(r"[0-9a-f]{15}", idx))
+    assert np.all(lat_ok), f"{int((~lat_ok).sum())} latitudes outside Cape Town bounds"
+    assert np.all(lon_ok), f"{int((~lon_ok).sum())} longitudes outside Cape Town bounds"
 
 
 def test_h3_index_valid(df):
-    idx = df["h3_level8_index"]
-    not_str = (~idx.map(lambda x: isinstance(x, str)))
+    is_str, ok = h3_res8_mask(df["h3_level8_index"])
+    not_str = ~is_str
     assert not not_str.any(), f"{int(not_str.sum())} H3 indexes are not strings"
-    bad = (~idx.map(_looks_like_h3_res8))
+    bad = ~ok
     msg = "" if HAS_H3 else " (heuristic used; install 'h3' for strict check)"
     assert not bad.any(), f"{int(bad.sum())} invalid/non-res8 H3 indexes{msg}"
 
 
 def test_wind_columns_bounds(df):
-    wd = pd.to_numeric(df["wind direction degree"], errors="coerce")
-    ws = pd.to_numeric(df["wind speed m/s"], errors="coerce")
-    assert wd.notna().all(), "NaN/unparseable wind direction values"
-    assert ws.notna().all(), "NaN/unparseable wind speed values"
-    assert ((wd >= 0) & (wd <= 360)).all(), "Wind direction outside [0, 360]"
-    assert (ws >= 0).all(), "Negative wind speeds"
-    assert (ws <= 40).all(), "Unreasonably high wind speeds (>40 m/s)"
+    wd = pd.to_numeric(df["wind direction degree"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    ws = pd.to_numeric(df["wind speed m/s"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    assert not np.isnan(wd).any(), "NaN/unparseable wind direction values"
+    assert not np.isnan(ws).any(), "NaN/unparseable wind speed values"
+    assert np.all((wd >= 0) & (wd <= 360)), "Wind direction outside [0, 360]"
+    assert np.all(ws >= 0), "Negative wind speeds"
+    assert np.all(ws <= 40), "Unreasonably high wind speeds (>40 m/s)"
 
 
 def test_distance_km_bounds(df):
-    dist = pd.to_numeric(df["distance_km"], errors="coerce")
-    assert dist.notna().all(), "NaN/unparseable distance_km values"
-    assert (dist >= 0).all(), "Negative distances"
-    assert (dist <= 50).all(), "Distances > 50 km look suspicious for a local subsample"
+    dist = pd.to_numeric(df["distance_km"], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    assert not np.isnan(dist).any(), "NaN/unparseable distance_km values"
+    assert np.all(dist >= 0), "Negative distances"
+    assert np.all(dist <= 50), "Distances > 50 km look suspicious for a local subsample"
 
 
 def test_mandatory_text_fields_nonempty(df):
     text_cols = ["official_suburb", "directorate", "department", "branch", "section", "code_group"]
-    empty_counts = {}
-    for col in text_cols:
-        s = df[col].astype(str).str.strip().str.lower()
-        empty = (s == "") | s.isin(["nan", "none"])
-        cnt = int(empty.sum())
-        if cnt:
-            empty_counts[col] = cnt
+    empty_counts = empty_text_counts(df, text_cols)
     assert not empty_counts, f"Empty values found in mandatory text fields: {empty_counts}"
 
 